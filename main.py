@@ -5,7 +5,7 @@ Monitors live calls from OrangeCarrier and sends recordings to Telegram
 
 REQUIREMENTS:
 1. Install Chrome/Chromium browser on your system
-2. Install FFmpeg:
+2. Install FFmpeg (WAV recordings are re-encoded as voice notes):
    - Ubuntu/Debian: sudo apt install ffmpeg
    - Windows: Download from https://ffmpeg.org/
    - Mac: brew install ffmpeg
@@ -19,6 +19,19 @@ Set the following environment variables:
 - TELEGRAM_BOT_TOKEN: Your Telegram bot token from @BotFather
 - TELEGRAM_CHAT_ID: Your Telegram channel/group chat ID
 
+Optional:
+- BROWSER_POOL_SIZE: Number of logged-in Chrome instances to keep (default 1)
+- ORANGECARRIER_COOKIE_FILE: Where login cookies are saved between restarts
+- STATE_DB: SQLite file remembering processed calls and phone lookups
+  (default bot_state.db)
+- PAGE_RELOAD_INTERVAL: Seconds between reloads of the live calls page
+  (default 0 = reload on every poll)
+- CAPTURE_PERF_LOGS: Set to 1 to also scan Chrome's performance log for audio URLs
+- DUMP_DEBUG_HTML: Set to 1 to save call_<id>_debug.html when no audio URL
+  is found (at most 20 per run)
+- LOG_LEVEL: Logging level (default INFO; DEBUG also saves page_debug.html
+  when no calls could be extracted)
+
 For security, credentials are loaded from environment variables instead of being hardcoded.
 """
 
@@ -30,6 +43,7 @@ try:
     import requests
     import phonenumbers
     import pytz
+    import mutagen
     from telegram import Bot
     from webdriver_manager.chrome import ChromeDriverManager
 except ImportError as e:
@@ -39,8 +53,14 @@ except ImportError as e:
 
 import os
 import time
+import json
+import queue
+import shutil
 import logging
 import requests
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -48,28 +68,58 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.constants import ParseMode
+from telegram.error import RetryAfter
+from telegram.request import HTTPXRequest
 import asyncio
 import phonenumbers
-from phonenumbers import geocoder
-import subprocess
+from phonenumbers import geocoder, region_code_for_number
+from mutagen import File as MutagenFile
 from datetime import datetime
+from functools import lru_cache
 import pytz
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+
+# HTTP/2 (Telegram and the sound API) needs the optional 'h2' package (python-telegram-bot[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+TELEGRAM_HTTP_VERSION = "2" if HTTP2_AVAILABLE else "1.1"
+
+# Faster JSON (performance logs, saved cookies) when 'orjson' is installed.
+# Both variants take str or bytes in and give bytes out.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
 
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO - far too chatty with twice-a-second size polls
+logging.getLogger('httpx').setLevel(logging.WARNING)
 
 # Configuration
 ORANGECARRIER_LOGIN_URL = "https://www.orangecarrier.com/login"
 ORANGECARRIER_CALLS_URL = "https://www.orangecarrier.com/live/calls"
+ORANGECARRIER_SOUND_URL = "https://www.orangecarrier.com/live/calls/sound"
 
 # SECURITY: Get credentials from environment variables ONLY
 # No hardcoded fallbacks for security reasons
@@ -78,6 +128,53 @@ LOGIN_PASSWORD = os.environ.get('ORANGECARRIER_PASSWORD')
 TELEGRAM_BOT_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN')
 TELEGRAM_CHAT_ID = os.environ.get('TELEGRAM_CHAT_ID')
 
+# Page resources blocked in Chrome - never block media, recordings are audio
+BLOCKED_RESOURCE_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.css',
+    '*/analytics*', '*/gtag*'
+]
+
+# Persistent bot state (processed calls) and dedupe bounds
+STATE_DB = os.environ.get('STATE_DB', 'bot_state.db')
+MAX_PROCESSED_CALLS = 50_000  # Kept in memory, oldest evicted first
+PROCESSED_CALLS_TTL = 24 * 3600  # Seconds a processed call is remembered
+PROCESSED_PRUNE_EVERY = 500  # mark_processed calls between expired-row cleanups
+PHONE_CACHE_TTL = 30 * 24 * 3600  # Seconds a number -> country lookup is reused
+
+# Debug: also capture Chrome's performance log when hunting for missed audio URLs
+CAPTURE_PERF_LOGS = os.environ.get('CAPTURE_PERF_LOGS') == '1'
+
+# Debug: dump the page of calls whose audio URL couldn't be found
+DUMP_DEBUG_HTML = os.environ.get('DUMP_DEBUG_HTML') == '1'
+MAX_DEBUG_DUMPS = 20  # Per run, so a burst of failures can't fill the disk
+
+# Telegram connection pool (multiplexed over HTTP/2 when available)
+TELEGRAM_POOL_SIZE = 20
+TELEGRAM_MAX_RETRIES = 5  # Attempts per send when Telegram answers 429
+TELEGRAM_MEDIA_WRITE_TIMEOUT = 60  # Seconds to upload one recording
+TELEGRAM_AUDIO_SUFFIXES = ('.mp3', '.m4a')  # Formats sendAudio plays inline
+VOICE_BITRATE = '32k'  # Opus bitrate for recordings re-encoded as voice notes
+FFMPEG_TIMEOUT = 60  # Seconds allowed for one voice conversion
+NOTIFICATION_BATCH_WINDOW = 0.2  # Seconds new calls are gathered into one instant notification
+MAX_CALLS_PER_NOTIFICATION = 30  # Keeps a batched notification well under Telegram's 4096 chars
+
+# Keep-alive connections to OrangeCarrier (sync session for browser-URL downloads)
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 20
+API_MAX_CONNECTIONS = 100  # Async sound API client, shared by every call being processed
+DOWNLOAD_READ_TIMEOUT = 60  # Seconds to wait for response headers / fixed-length body data
+DOWNLOAD_STALL_TIMEOUT = 10  # Seconds without new bytes before an open-ended recording counts as done
+
+# Browser pool - each instance is a logged-in Chrome reused across scrapes
+BROWSER_POOL_SIZE = int(os.environ.get('BROWSER_POOL_SIZE', '1'))
+MAX_USES_PER_INSTANCE = 50  # Recycle Chrome after this many acquisitions
+SELENIUM_POOL_MAXSIZE = 20  # Concurrent HTTP connections to each chromedriver
+COOKIE_FILE = os.environ.get('ORANGECARRIER_COOKIE_FILE', 'orangecarrier_cookies.json')
+# Seconds between reloads of the live calls page - 0 reloads on every poll,
+# raise it only if the page is known to refresh its own table
+PAGE_RELOAD_INTERVAL = float(os.environ.get('PAGE_RELOAD_INTERVAL', '0'))
+
 # Validate required credentials are set
 if not all([LOGIN_EMAIL, LOGIN_PASSWORD, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID]):
     # Fallback to hardcoded for testing ONLY - WARNING: Remove in production!
@@ -87,65 +184,328 @@ if not all([LOGIN_EMAIL, LOGIN_PASSWORD, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID]):
     TELEGRAM_CHAT_ID = TELEGRAM_CHAT_ID or '-1003259473005'
     logger.warning("⚠️ SECURITY WARNING: Using hardcoded credentials! Set environment variables in production!")
 
-# Track processed calls to avoid duplicates
-processed_calls = set()
+# Precompiled patterns used on every poll cycle
+# Call UUID inside outerHTML: playCall('...'), any quoted value in onclick, or a
+# data-uuid / data-call-id / data-id / bare id attribute (not aria-id and the
+# like). Serialized HTML always double-quotes attributes, so inner quotes show
+# up as ' or &quot;. The uuid must be a whole token - 1761406796.38x or a
+# longer number is not a match.
+_UUID_UNIFIED_RE = re.compile(
+    r'(?:playCall\(|onclick="[^"]*?|data-(?:uuid|call-id|id)="|(?<![\w-])id=")'
+    r"(?:'|&quot;)?(?<![\w.])(?P<uuid>\d{10,}\.\d+)(?![\w.])"
+)
+_PHONE_CLEAN_RE = re.compile(r'[^\d+]')
+_PREFIX_RE = re.compile(r'\+?(\d{1,4})')
+# Audio URL classification in extract_audio_url - one case-insensitive scan each
+# instead of lower() plus a chain of substring checks
+_NOTIFICATION_RE = re.compile(r'notification', re.I)
+_AUDIO_URL_RE = re.compile(r'/audio/|recording|call|\.(?:mp3|wav|ogg|m4a|webm)$', re.I)
+_PREFERRED_URL_RE = re.compile(r'record|call|did|cli', re.I)
+# Anything _AUDIO_URL_RE or an audio mimeType could match - checked on the raw
+# performance-log message, so events that can't be audio are never decoded
+_AUDIO_HINT_RE = re.compile(r'audio|recording|call|\.(?:mp3|wav|ogg|m4a|webm)\b', re.I)
+_CONTENT_RANGE_TOTAL_RE = re.compile(r'/(\d+)$')
+
+# Workers for per-row UUID parsing and country lookup in get_active_calls
+_ENRICH_EXECUTOR = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+
+# Single writer for debug HTML dumps - keeps disk I/O off the scraping threads
+# and rotation of the same file in order
+_DUMP_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# Track processed calls to avoid duplicates - bounded in memory and persisted
+# to SQLite so a restart doesn't forward the same calls again
+processed_calls = OrderedDict()
+_state_db = None
+_state_db_lock = threading.Lock()
+_marks_since_prune = 0
+
+
+def _get_state_db():
+    """Open (once) the SQLite file holding bot state"""
+    global _state_db
+    with _state_db_lock:
+        if _state_db is None:
+            _state_db = sqlite3.connect(STATE_DB, check_same_thread=False)
+            _state_db.execute("PRAGMA journal_mode=WAL")
+            _state_db.execute(
+                "CREATE TABLE IF NOT EXISTS processed (id TEXT PRIMARY KEY, seen_at REAL NOT NULL)"
+            )
+            _state_db.execute("CREATE INDEX IF NOT EXISTS processed_seen_at ON processed (seen_at)")
+            _state_db.execute(
+                "CREATE TABLE IF NOT EXISTS phone_cache "
+                "(number TEXT PRIMARY KEY, flag TEXT NOT NULL, country TEXT NOT NULL, cached_at REAL NOT NULL)"
+            )
+            _state_db.commit()
+        return _state_db
+
+
+def _remember_processed(call_id):
+    """Add to the in-memory LRU, evicting the least recently seen entries past the bound"""
+    processed_calls[call_id] = None
+    while len(processed_calls) > MAX_PROCESSED_CALLS:
+        processed_calls.popitem(last=False)
+
+
+def load_processed_calls():
+    """Load calls processed within PROCESSED_CALLS_TTL into memory, dropping older rows"""
+    db = _get_state_db()
+    cutoff = time.time() - PROCESSED_CALLS_TTL
+    with _state_db_lock:
+        db.execute("DELETE FROM processed WHERE seen_at < ?", (cutoff,))
+        db.commit()
+        rows = db.execute(
+            "SELECT id FROM processed ORDER BY seen_at DESC LIMIT ?", (MAX_PROCESSED_CALLS,)
+        ).fetchall()
+
+    for (call_id,) in reversed(rows):
+        _remember_processed(call_id)
+    logger.info(f"✓ Loaded {len(processed_calls)} recently processed call(s) from {STATE_DB}")
+
+
+def is_processed(call_id):
+    """Check memory first, then the database for entries evicted from memory"""
+    if call_id in processed_calls:
+        # LRU, not FIFO - calls still listed on the page are hit every poll
+        # and must stay in memory ahead of ones that scrolled away
+        processed_calls.move_to_end(call_id)
+        return True
+
+    db = _get_state_db()
+    cutoff = time.time() - PROCESSED_CALLS_TTL
+    with _state_db_lock:
+        row = db.execute(
+            "SELECT 1 FROM processed WHERE id = ? AND seen_at >= ?", (call_id, cutoff)
+        ).fetchone()
+    if row is None:
+        return False
+
+    # Evicted but still recent - bring it back so the next poll is a memory hit
+    _remember_processed(call_id)
+    return True
+
+
+def _phone_cache_get(number):
+    """(flag, country) from the on-disk phone cache, or None if missing/expired"""
+    try:
+        db = _get_state_db()
+        cutoff = time.time() - PHONE_CACHE_TTL
+        with _state_db_lock:
+            row = db.execute(
+                "SELECT flag, country FROM phone_cache WHERE number = ? AND cached_at >= ?", (number, cutoff)
+            ).fetchone()
+        return tuple(row) if row else None
+    except Exception as e:
+        logger.debug(f"Phone cache read failed: {e}")
+        return None
+
+
+def _phone_cache_put(number, flag, country):
+    """Store a resolved (flag, country) so restarts don't re-parse known numbers"""
+    try:
+        db = _get_state_db()
+        with _state_db_lock:
+            db.execute(
+                "INSERT OR REPLACE INTO phone_cache (number, flag, country, cached_at) VALUES (?, ?, ?, ?)",
+                (number, flag, country, time.time())
+            )
+            db.commit()
+    except Exception as e:
+        logger.debug(f"Phone cache write failed: {e}")
+
+
+def mark_processed(call_id):
+    """Record a call as handled in memory and on disk, pruning expired rows now and then"""
+    global _marks_since_prune
+    _remember_processed(call_id)
+    db = _get_state_db()
+    now = time.time()
+    with _state_db_lock:
+        db.execute(
+            "INSERT OR REPLACE INTO processed (id, seen_at) VALUES (?, ?)", (call_id, now)
+        )
+        # Long-running bots never restart, so load_processed_calls' cleanup
+        # alone would let the table grow without bound
+        _marks_since_prune += 1
+        if _marks_since_prune >= PROCESSED_PRUNE_EVERY:
+            _marks_since_prune = 0
+            db.execute("DELETE FROM processed WHERE seen_at < ?", (now - PROCESSED_CALLS_TTL,))
+        db.commit()
 
 # ISO 3166-1 alpha-2 code to flag emoji mapping (240+ countries/territories)
+# Each letter corresponds to a regional indicator symbol (🇦 = U+1F1E6, 🇿 = U+1F1FF).
+# All 676 two-letter combinations are built once at import.
+_FLAG_TABLE = {
+    chr(a) + chr(b): chr(0x1F1E6 + a - 65) + chr(0x1F1E6 + b - 65)
+    for a in range(65, 91)
+    for b in range(65, 91)
+}
+
 def country_code_to_flag(country_code):
     """Convert ISO country code to flag emoji"""
     if not country_code or len(country_code) != 2:
         return '🌍'
+    return _FLAG_TABLE.get(country_code.upper(), '🌍')
+
+
+@lru_cache(maxsize=1024)
+def _country_from_prefix(prefix):
+    """Resolve (flag, name) from the country calling code alone"""
+    # Only used when the full number can't be parsed - calling codes such as
+    # +1 or +7 are shared by several countries, so this is a best guess
+    country_iso = phonenumbers.region_code_for_country_code(int(prefix))
+    if country_iso in (None, 'ZZ', '001'):
+        return '🌍', f"Country Code +{prefix}"
+    return country_code_to_flag(country_iso), f"Country Code +{prefix}"
+
+
+@lru_cache(maxsize=4096)
+def _lookup_country(clean_number):
+    """Cached (flag, name) lookup for an already normalized +E.164-ish number"""
+    # Survives restarts - phonenumbers' geocoder metadata is slow to load cold
+    cached = _phone_cache_get(clean_number)
+    if cached:
+        return cached
+
+    # Parse with phonenumbers library (supports all countries automatically)
+    try:
+        parsed = phonenumbers.parse(clean_number, None)
+
+        # Get country ISO code (e.g., 'US', 'GB', 'UZ', 'BD', etc.)
+        country_iso = region_code_for_number(parsed)
+
+        # Get country name
+        country_name = geocoder.description_for_number(parsed, "en")
+
+        # Convert ISO code to flag emoji
+        flag = country_code_to_flag(country_iso) if country_iso else '🌍'
+
+        # If country name is empty, try to get it from region
+        if not country_name:
+            country_name = f"{country_iso} +{parsed.country_code}" if country_iso else f"+{parsed.country_code}"
+
+        _phone_cache_put(clean_number, flag, country_name)
+        return flag, country_name
+
+    except Exception as parse_error:
+        logger.debug(f"Error parsing phone number: {parse_error}")
+        # Try basic extraction as fallback
+        match = _PREFIX_RE.match(clean_number)
+        if match:
+            return _country_from_prefix(match.group(1))
+
+    # Default
+    return '🌍', "Unknown"
 
-    # Convert country code to flag emoji using Unicode regional indicator symbols
-    # Each letter corresponds to a regional indicator symbol (🇦 = U+1F1E6, 🇿 = U+1F1FF)
-    country_code = country_code.upper()
-    flag = ''.join(chr(0x1F1E6 + ord(char) - ord('A')) for char in country_code)
-    return flag
 
 def get_country_flag_and_name(phone_number):
     """Get country flag and name from phone number - supports 240+ countries"""
     try:
         # Clean the phone number
-        clean_number = re.sub(r'[^\d+]', '', str(phone_number))
+        clean_number = _PHONE_CLEAN_RE.sub('', str(phone_number))
 
         # Add + if not present
         if not clean_number.startswith('+'):
             clean_number = '+' + clean_number
 
-        # Parse with phonenumbers library (supports all countries automatically)
-        try:
-            parsed = phonenumbers.parse(clean_number, None)
+        # Normalized numbers share one cache entry ("+1 202..." == "1202...")
+        return _lookup_country(clean_number)
 
-            # Get country ISO code (e.g., 'US', 'GB', 'UZ', 'BD', etc.)
-            from phonenumbers import region_code_for_number
-            country_iso = region_code_for_number(parsed)
+    except Exception as e:
+        logger.debug(f"Error detecting country: {e}")
+        return '🌍', "Unknown"
 
-            # Get country name
-            country_name = geocoder.description_for_number(parsed, "en")
 
-            # Convert ISO code to flag emoji
-            flag = country_code_to_flag(country_iso) if country_iso else '🌍'
+@lru_cache(maxsize=4096)
+def mask_phone_number(did):
+    """Mask a DID for display - country code and last 3 digits only (cached per DID)"""
+    # Ensure phone number has + prefix
+    phone_display = did if did.startswith('+') else f"+{did}"
 
-            # If country name is empty, try to get it from region
-            if not country_name:
-                country_name = f"{country_iso} +{parsed.country_code}" if country_iso else f"+{parsed.country_code}"
+    # Extract country code and mask rest except last 3 digits
+    try:
+        parsed = phonenumbers.parse(phone_display, None)
+        country_code = f"+{parsed.country_code}"
+        # Get the number part without country code
+        national_number = str(parsed.national_number)
+        # Mask all digits except last 3
+        if len(national_number) > 3:
+            masked_national = '*' * (len(national_number) - 3) + national_number[-3:]
+        else:
+            masked_national = national_number
+        return country_code + masked_national
+    except Exception:
+        # Fallback if parsing fails
+        if len(phone_display) > 7:
+            return phone_display[:4] + '******' + phone_display[-3:]
+        return phone_display
+
+
+# Injected into every page at load time: records the URL of every completed
+# network response, so audio URLs arrive as events instead of being dug out of
+# Chrome's performance log
+_RESOURCE_OBSERVER_JS = """
+window.__ocResources = [];
+new PerformanceObserver(list => {
+    for (const entry of list.getEntries()) window.__ocResources.push(entry.name);
+}).observe({type: 'resource', buffered: true});
+"""
 
-            return flag, country_name
+# Returns and clears the response URLs collected since the last call
+_TAKE_RESOURCES_JS = "return (window.__ocResources || []).splice(0);"
 
-        except Exception as parse_error:
-            logger.debug(f"Error parsing phone number: {parse_error}")
-            # Try basic extraction as fallback
-            match = re.match(r'\+?(\d{1,4})', clean_number)
-            if match:
-                code = match.group(1)
-                return '🌍', f"Country Code +{code}"
+# Selenium's urllib3 PoolManager keeps a single connection per chromedriver,
+# so commands from several threads queue up and log "connection pool is full".
+# Wrap the factory (keeps Selenium's proxy/CA handling) and widen the pool.
+_original_get_connection_manager = RemoteConnection._get_connection_manager
 
-        # Default
-        return '🌍', "Unknown"
 
-    except Exception as e:
-        logger.debug(f"Error detecting country: {e}")
-        return '🌍', "Unknown"
+def _get_pooled_connection_manager(self):
+    manager = _original_get_connection_manager(self)
+    manager.connection_pool_kw['maxsize'] = SELENIUM_POOL_MAXSIZE
+    return manager
+
+
+RemoteConnection._get_connection_manager = _get_pooled_connection_manager
+
+
+# Browser/driver locations don't change while the bot runs - look them up once
+# instead of walking PATH on every (pool) driver start
+@lru_cache(maxsize=1)
+def _detect_chrome():
+    """Path to the Chrome/Chromium binary, or None to use the system default"""
+    # Check environment variable first (allows user override)
+    chrome_binary = os.environ.get('CHROME_BINARY')
+    if chrome_binary and os.path.exists(chrome_binary):
+        logger.info(f"Using Chrome from CHROME_BINARY: {chrome_binary}")
+        return chrome_binary
+
+    # Auto-detect common Chrome/Chromium locations
+    for binary_name in ['chromium', 'chromium-browser', 'google-chrome', 'chrome']:
+        binary_path = shutil.which(binary_name)
+        if binary_path:
+            logger.info(f"Auto-detected {binary_name} at: {binary_path}")
+            return binary_path
+
+    return None
+
+
+@lru_cache(maxsize=1)
+def _detect_chromedriver():
+    """Path to a local chromedriver, or None to fall back to webdriver-manager"""
+    # Check environment variable for custom chromedriver path
+    chromedriver_path = os.environ.get('CHROMEDRIVER_PATH')
+    if chromedriver_path and os.path.exists(chromedriver_path):
+        logger.info(f"Using ChromeDriver from CHROMEDRIVER_PATH: {chromedriver_path}")
+        return chromedriver_path
+
+    # Try to find chromedriver in PATH first (works on Replit and most systems)
+    chromedriver_in_path = shutil.which('chromedriver')
+    if chromedriver_in_path:
+        logger.info(f"Using ChromeDriver from PATH: {chromedriver_in_path}")
+        return chromedriver_in_path
+
+    return None
 
 
 def setup_driver():
@@ -161,52 +521,37 @@ def setup_driver():
     chrome_options.add_argument('--autoplay-policy=no-user-gesture-required')
 
     # Portable Chrome/Chromium detection (works on any platform)
-    import shutil
-
-    # Check environment variable first (allows user override)
-    chrome_binary = os.environ.get('CHROME_BINARY')
-    if chrome_binary and os.path.exists(chrome_binary):
+    chrome_binary = _detect_chrome()
+    if chrome_binary:
         chrome_options.binary_location = chrome_binary
-        logger.info(f"Using Chrome from CHROME_BINARY: {chrome_binary}")
-    else:
-        # Auto-detect common Chrome/Chromium locations
-        for binary_name in ['chromium', 'chromium-browser', 'google-chrome', 'chrome']:
-            binary_path = shutil.which(binary_name)
-            if binary_path:
-                chrome_options.binary_location = binary_path
-                logger.info(f"Auto-detected {binary_name} at: {binary_path}")
-                break
-        # If none found, let Chrome use system default
+    # If none found, let Chrome use system default
 
     # Enable audio and performance logging
     prefs = {
         'profile.default_content_setting_values.media_stream_mic': 1,
         'profile.default_content_setting_values.media_stream_camera': 1,
-        'profile.default_content_setting_values.notifications': 1
+        'profile.default_content_setting_values.notifications': 1,
+        # Only the calls table is scraped - don't download or decode images
+        'profile.managed_default_content_settings.images': 2
     }
     chrome_options.add_experimental_option('prefs', prefs)
 
-    # Enable performance logging to capture network requests
-    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL', 'browser': 'ALL'})
+    # Performance logging makes Chrome buffer (and ship) every network event as
+    # JSON - response URLs already come from _RESOURCE_OBSERVER_JS, so only turn
+    # it on when debugging a missed recording
+    if CAPTURE_PERF_LOGS:
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL', 'browser': 'ALL'})
 
     # Portable ChromeDriver setup using webdriver-manager
     # Works on Windows, Linux, Mac, Replit, and any other platform
     try:
-        # Check environment variable for custom chromedriver path
-        chromedriver_path = os.environ.get('CHROMEDRIVER_PATH')
-        if chromedriver_path and os.path.exists(chromedriver_path):
+        chromedriver_path = _detect_chromedriver()
+        if chromedriver_path:
             service = Service(chromedriver_path)
-            logger.info(f"Using ChromeDriver from CHROMEDRIVER_PATH: {chromedriver_path}")
         else:
-            # Try to find chromedriver in PATH first (works on Replit and most systems)
-            chromedriver_in_path = shutil.which('chromedriver')
-            if chromedriver_in_path:
-                service = Service(chromedriver_in_path)
-                logger.info(f"Using ChromeDriver from PATH: {chromedriver_in_path}")
-            else:
-                # Use webdriver-manager for automatic cross-platform chromedriver management
-                service = Service(ChromeDriverManager().install())
-                logger.info("Using webdriver-manager for ChromeDriver")
+            # Use webdriver-manager for automatic cross-platform chromedriver management
+            service = Service(ChromeDriverManager().install())
+            logger.info("Using webdriver-manager for ChromeDriver")
 
         driver = webdriver.Chrome(service=service, options=chrome_options)
     except Exception as e:
@@ -223,6 +568,12 @@ def setup_driver():
     # Enable Network domain for CDP
     driver.execute_cdp_cmd('Network.enable', {})
 
+    # Skip resources the scraper never looks at (audio/media stays allowed)
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_URLS})
+
+    # Report every response URL to the page as it completes (see _RESOURCE_OBSERVER_JS)
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _RESOURCE_OBSERVER_JS})
+
     return driver
 
 
@@ -263,154 +614,314 @@ def login_to_orangecarrier(driver):
         return False
 
 
-def get_active_calls(driver):
-    """Extract active calls from the page - Updated to match OrangeCarrier's table structure"""
+def save_session_cookies(driver):
+    """Persist the logged-in session cookies so new browsers can skip the login form"""
     try:
-        # Save page source for debugging
-        with open('page_debug.html', 'w', encoding='utf-8') as f:
-            f.write(driver.page_source)
+        cookies = driver.get_cookies()
+        # Session cookies are as good as the password - keep them private
+        fd = os.open(COOKIE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_json_dumps(cookies))
+        logger.info(f"✓ Saved {len(cookies)} session cookies to {COOKIE_FILE}")
+    except Exception as e:
+        logger.warning(f"⚠ Could not save session cookies: {e}")
+
+
+def restore_session(driver):
+    """Inject saved session cookies - returns True if they are still logged in"""
+    if not os.path.exists(COOKIE_FILE):
+        return False
+
+    try:
+        with open(COOKIE_FILE, 'rb') as f:
+            cookies = _json_loads(f.read())
+
+        # Cookies can only be added for the domain that is currently loaded
+        driver.get(ORANGECARRIER_LOGIN_URL)
+        for cookie in cookies:
+            try:
+                driver.add_cookie(cookie)
+            except Exception as e:
+                logger.debug(f"Skipping cookie {cookie.get('name')}: {e}")
+
+        # A valid session stays on the calls page instead of bouncing to login
+        driver.get(ORANGECARRIER_CALLS_URL)
+        if '/login' in driver.current_url:
+            logger.info("Saved session expired, logging in again...")
+            return False
+
+        logger.info("✓ Restored session from saved cookies")
+        return True
+
+    except Exception as e:
+        logger.warning(f"⚠ Could not restore saved session: {e}")
+        return False
+
+
+class BrowserPool:
+    """Pool of logged-in Chrome drivers, reused instead of relaunching per session"""
+
+    def __init__(self, size=BROWSER_POOL_SIZE, max_uses=MAX_USES_PER_INSTANCE):
+        self.size = size
+        self.max_uses = max_uses
+        self._idle = queue.Queue(maxsize=size)
+        self._uses = {}
+        self._drivers = []
+        self._missing = 0  # Discarded browsers whose replacement failed to launch
+        self._lock = threading.Lock()
+
+    def _new_driver(self):
+        """Launch Chrome and log it in (via saved cookies when possible)"""
+        driver = setup_driver()
+        if not restore_session(driver):
+            if not login_to_orangecarrier(driver):
+                driver.quit()
+                raise RuntimeError("Login failed")
+            save_session_cookies(driver)
+
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self._drivers.append(driver)
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Error closing browser: {e}")
+
+    def warm_up(self):
+        """Start and log in every browser up front"""
+        for _ in range(self.size):
+            self._idle.put(self._new_driver())
+        logger.info(f"✓ Browser pool ready with {self.size} instance(s)")
+
+    def acquire(self, timeout=None):
+        """Take a logged-in driver out of the pool (launching one to fill a missing slot)"""
+        with self._lock:
+            refill = self._missing > 0
+            if refill:
+                self._missing -= 1
+
+        if refill:
+            try:
+                driver = self._new_driver()
+            except Exception:
+                with self._lock:
+                    self._missing += 1
+                raise
+        else:
+            driver = self._idle.get(timeout=timeout)
+
+        with self._lock:
+            self._uses[id(driver)] += 1
+        return driver
+
+    def release(self, driver, broken=False):
+        """Return a driver, recycling it if it failed or has been used too often"""
+        with self._lock:
+            worn_out = self._uses.get(id(driver), 0) >= self.max_uses
+
+        if broken or worn_out:
+            logger.info(f"♻ Recycling browser ({'failed' if broken else 'max uses reached'})")
+            self._discard(driver)
+            try:
+                driver = self._new_driver()
+            except Exception:
+                # Remember the empty slot so a later acquire() relaunches it
+                with self._lock:
+                    self._missing += 1
+                raise
+
+        self._idle.put(driver)
+
+    def close(self):
+        """Quit every browser owned by the pool"""
+        with self._lock:
+            drivers = list(self._drivers)
+        for driver in drivers:
+            self._discard(driver)
+
+
+# Serializes the live calls table in a single WebDriver round-trip.
+# Returned elements come back as WebElements, so the play button and row
+# can still be clicked/watched later without another lookup.
+_READ_CALL_ROWS_JS = """
+const out = [];
+document.querySelectorAll('table.table tbody tr').forEach(tr => {
+    const cells = tr.querySelectorAll('td');
+    if (cells.length < 5) return;  // Termination, DID, CLI, Duration, Revenue
+    const button = tr.querySelector("button[class*='btn']") ||
+                   tr.querySelector('button') ||
+                   tr.querySelector("[class*='play'], [onclick*='play']");
+    out.push({
+        termination: cells[0].innerText.trim(),
+        did: cells[1].innerText.trim(),
+        cli: cells[2].innerText.trim(),
+        duration: cells[3].innerText.trim(),
+        revenue: cells[4].innerText.trim(),
+        button: button,
+        button_html: button ? button.outerHTML : '',
+        row: tr,
+        row_tag: tr.cloneNode(false).outerHTML  // <tr ...> without its cells
+    });
+});
+return out;
+"""
+
+
+def _extract_uuid(html):
+    """Find the call UUID (e.g. 1761406796.3808732) in play button / row HTML in one scan"""
+    uuid_match = _UUID_UNIFIED_RE.search(html or '')
+    return uuid_match.group('uuid') if uuid_match else None
+
+
+_debug_dumps_left = MAX_DEBUG_DUMPS
+_debug_dumps_lock = threading.Lock()
+
+
+def _claim_debug_dump():
+    """True while the per-run budget of call debug dumps isn't used up"""
+    global _debug_dumps_left
+    with _debug_dumps_lock:
+        if _debug_dumps_left <= 0:
+            return False
+        _debug_dumps_left -= 1
+        return True
+
+
+def _write_page_source(html, filename, keep):
+    """Rotate older copies of filename and write html to it atomically"""
+    try:
+        # Rotate older dumps: page_debug.html -> page_debug.html.1 -> page_debug.html.2
+        for i in range(keep - 1, 0, -1):
+            older = filename if i == 1 else f"{filename}.{i - 1}"
+            if os.path.exists(older):
+                os.replace(older, f"{filename}.{i}")
+
+        # Write atomically so a crash never leaves a half-written dump
+        tmp_filename = f"{filename}.tmp"
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            f.write(html)
+        os.replace(tmp_filename, filename)
+        logger.debug(f"Saved page source to {filename}")
+
+    except Exception as e:
+        logger.debug(f"Could not save page source: {e}")
+
+
+def _dump_page_source(driver, filename, keep=3):
+    """Save the current page HTML for debugging in the background, keeping the last `keep` copies"""
+    try:
+        # Grab the HTML now (the page moves on), write it off-thread
+        _DUMP_EXECUTOR.submit(_write_page_source, driver.page_source, filename, keep)
+    except Exception as e:
+        logger.debug(f"Could not save page source: {e}")
 
-        # Wait for the table to load
-        time.sleep(2)
 
-        calls = []
+# Columns of the call table returned by get_active_calls
+CALL_FIELDS = ('id', 'termination', 'did', 'cli', 'duration', 'revenue', 'uuid',
+               'flag', 'country', 'play_button', 'row')
+
+
+def _new_call_table():
+    """Empty column-oriented call table - one list per field in CALL_FIELDS"""
+    return {field: [] for field in CALL_FIELDS}
+
+
+def _append_call(calls, values):
+    """Append one call (values in CALL_FIELDS order) to a call table"""
+    for field, value in zip(CALL_FIELDS, values):
+        calls[field].append(value)
+
+
+def call_at(calls, index):
+    """Materialize one row of a call table as the per-call dict used downstream"""
+    return {field: calls[field][index] for field in CALL_FIELDS}
+
+
+def _enrich_row(row_data):
+    """Turn one row from _READ_CALL_ROWS_JS into call values (CALL_FIELDS order), or None to skip it"""
+    try:
+        termination = row_data['termination']
+        did = row_data['did']
+        cli = row_data['cli']
+        play_button = row_data['button']
+
+        if not play_button:
+            logger.debug("No play button found for row")
+            return None
+
+        # Extract UUID from play button / row HTML - REQUIRED for API method!
+        try:
+            # Button first so its attributes win over the row's
+            uuid = _extract_uuid(row_data['button_html'] + row_data['row_tag'])
+
+            if uuid:
+                logger.info(f"✅ Valid UUID extracted: {uuid}")
+            else:
+                logger.warning(f"⚠ Could not extract UUID for call {did} - skipping (API requires UUID)")
+                # Debug: print button HTML for analysis
+                logger.debug(f"Button HTML: {row_data['button_html'][:200]}")
+                return None  # Skip this call if no UUID found
+        except Exception as e:
+            logger.warning(f"⚠ UUID extraction error for {did}: {e} - skipping")
+            return None  # Skip this call on error
+
+        # Resolve the country now so the Telegram senders hit a warm cache
+        flag, country_name = get_country_flag_and_name(did)
+
+        # Values in CALL_FIELDS order - unique identifier uses termination, did, cli
+        return (f"{termination}_{did}_{cli}", termination, did, cli,
+                row_data['duration'], row_data['revenue'], uuid,
+                flag, country_name, play_button, row_data['row'])
+
+    except Exception as e:
+        logger.debug(f"Error processing row: {e}")
+        return None
+
+
+def get_active_calls(driver):
+    """Extract active calls from the page - Updated to match OrangeCarrier's table structure
+
+    Returns a column-oriented table ({field: [values...]} for CALL_FIELDS);
+    use call_at() to get a single call as a dict.
+    """
+    try:
+        # Wait for the table to load - returns at once when it's already there
+        try:
+            WebDriverWait(driver, 10, poll_frequency=0.2).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "table.table"))
+            )
+        except TimeoutException:
+            logger.debug("Calls table not found on page")
+
+        calls = _new_call_table()
 
         # Method 1: Look for table with class "table" that has active calls
         # According to screenshot, table structure is:
         # Termination | DID | CLI | Duration | Revenue | [Play Button]
         try:
-            # Find all tables on the page
-            tables = driver.find_elements(By.CSS_SELECTOR, "table.table")
-
-            for table in tables:
-                # Get all rows from tbody
-                tbody = table.find_element(By.TAG_NAME, "tbody")
-                rows = tbody.find_elements(By.TAG_NAME, "tr")
-
-                logger.info(f"Found {len(rows)} row(s) in table")
-
-                for row in rows:
-                    try:
-                        # Get all cells
-                        cells = row.find_elements(By.TAG_NAME, "td")
-
-                        if len(cells) >= 5:  # Termination, DID, CLI, Duration, Revenue
-                            termination = cells[0].text.strip()
-                            did = cells[1].text.strip()
-                            cli = cells[2].text.strip()
-                            duration = cells[3].text.strip()
-                            revenue = cells[4].text.strip()
-
-                            # Look for play button in the last cell or anywhere in the row
-                            play_button = None
-                            uuid = None
-                            try:
-                                # Try finding button in the row
-                                play_button = row.find_element(By.CSS_SELECTOR, "button[class*='btn']")
-                            except:
-                                try:
-                                    # Try alternative selectors
-                                    play_button = row.find_element(By.XPATH, ".//button")
-                                except:
-                                    # Look for any clickable element
-                                    try:
-                                        play_button = row.find_element(By.XPATH, ".//*[contains(@class, 'play') or contains(@onclick, 'play')]")
-                                    except:
-                                        logger.debug(f"No play button found for row")
-                                        continue
-
-                            # Extract UUID from play button attributes - REQUIRED for API method!
-                            if play_button:
-                                try:
-                                    uuid = None
-
-                                    # Try onclick attribute first (most reliable)
-                                    onclick = play_button.get_attribute('onclick')
-                                    if onclick:
-                                        # Extract UUID - try multiple patterns
-                                        import re
-                                        # Pattern 1: playCall('1761406796.3808732') or playCall("1761406796.3808732")
-                                        uuid_match = re.search(r"playCall\(['\"](\d+\.\d+)['\"]\)", onclick)
-                                        if uuid_match:
-                                            uuid = uuid_match.group(1)
-                                        else:
-                                            # Pattern 2: any number.number format in quotes
-                                            uuid_match = re.search(r"['\"](\d{10,}\.\d+)['\"]", onclick)
-                                            if uuid_match:
-                                                uuid = uuid_match.group(1)
-
-                                        if uuid:
-                                            logger.info(f"✓ Extracted UUID from onclick: {uuid}")
-
-                                    # Fallback: Try all possible attributes
-                                    if not uuid:
-                                        for attr in ['data-uuid', 'data-call-id', 'data-id', 'id']:
-                                            uuid = play_button.get_attribute(attr)
-                                            if uuid and re.match(r'^\d{10,}\.\d+$', uuid):
-                                                logger.info(f"✓ Extracted UUID from {attr}: {uuid}")
-                                                break
-                                            uuid = None
-
-                                    # Try extracting from button's parent row attributes
-                                    if not uuid:
-                                        try:
-                                            parent_row = play_button.find_element(By.XPATH, "./ancestor::tr[1]")
-                                            for attr in ['data-uuid', 'data-call-id', 'data-id']:
-                                                uuid = parent_row.get_attribute(attr)
-                                                if uuid and re.match(r'^\d{10,}\.\d+$', uuid):
-                                                    logger.info(f"✓ Extracted UUID from row {attr}: {uuid}")
-                                                    break
-                                                uuid = None
-                                        except:
-                                            pass
-
-                                    # Validate UUID format (should be like: 1234567890.12345)
-                                    if uuid:
-                                        if not re.match(r'^\d{10,}\.\d+$', uuid):
-                                            logger.warning(f"⚠ Invalid UUID format '{uuid}' for call {did} - skipping")
-                                            continue
-                                        logger.info(f"✅ Valid UUID extracted: {uuid}")
-                                    else:
-                                        logger.warning(f"⚠ Could not extract UUID for call {did} - skipping (API requires UUID)")
-                                        # Debug: print button HTML for analysis
-                                        try:
-                                            button_html = play_button.get_attribute('outerHTML')
-                                            logger.debug(f"Button HTML: {button_html[:200]}")
-                                        except:
-                                            pass
-                                        continue  # Skip this call if no UUID found
-                                except Exception as e:
-                                    logger.warning(f"⚠ UUID extraction error for {did}: {e} - skipping")
-                                    continue  # Skip this call on error
-
-                            # Create unique identifier using termination, did, cli
-                            call_id = f"{termination}_{did}_{cli}"
-
-                            # Check if already processed and validate data
-                            if call_id not in processed_calls and did and cli:
-                                logger.info(f"Found call: Termination={termination}, DID={did}, CLI={cli}, Duration={duration}, Revenue={revenue}, UUID={uuid or 'N/A'}")
-
-                                calls.append({
-                                    'id': call_id,
-                                    'termination': termination,
-                                    'did': did,
-                                    'cli': cli,
-                                    'duration': duration,
-                                    'revenue': revenue,
-                                    'uuid': uuid,
-                                    'play_button': play_button,
-                                    'row': row
-                                })
-
-                    except Exception as e:
-                        logger.debug(f"Error processing row: {e}")
-                        continue
+            # Read every row in ONE round-trip instead of one per cell/attribute
+            rows = driver.execute_script(_READ_CALL_ROWS_JS)
+
+            logger.info(f"Found {len(rows)} row(s) in table")
+
+            # UUID parsing + country lookup run in parallel across rows
+            for values in _ENRICH_EXECUTOR.map(_enrich_row, rows):
+                # Validate data - dedupe happens in monitor_calls
+                if values and values[2] and values[3]:  # did, cli
+                    _append_call(calls, values)
 
         except Exception as e:
             logger.debug(f"Table method 1 failed: {e}")
 
         # Method 2: If no calls found, try direct play button search (fallback)
-        if not calls:
+        if not calls['id']:
             logger.info("Trying fallback method to find play buttons...")
             play_buttons = driver.find_elements(By.XPATH, "//button[contains(@class, 'btn')]")
 
@@ -425,59 +936,26 @@ def get_active_calls(driver):
                         if row.tag_name == 'tr':
                             break
 
-                    # Extract all td elements from the row
-                    cells = row.find_elements(By.TAG_NAME, "td")
+                    # Read every cell's text in one round-trip
+                    cell_texts = driver.execute_script(
+                        "return [...(arguments[0].cells || [])].map(c => c.innerText.trim())", row
+                    ) or []
 
-                    if len(cells) >= 5:
+                    if len(cell_texts) >= 5:
                         # Extract call information from cells (Termination, DID, CLI, Duration, Revenue)
-                        termination = cells[0].text.strip()
-                        did = cells[1].text.strip()
-                        cli = cells[2].text.strip()
-                        duration = cells[3].text.strip()
-                        revenue = cells[4].text.strip()
+                        termination, did, cli, duration, revenue = cell_texts[:5]
 
                         # Extract UUID from button - REQUIRED for API method!
-                        uuid = None
                         try:
-                            # Try onclick attribute first (most reliable)
-                            onclick = button.get_attribute('onclick')
-                            if onclick:
-                                import re
-                                # Pattern 1: playCall('1761406796.3808732')
-                                uuid_match = re.search(r"playCall\(['\"](\d+\.\d+)['\"]\)", onclick)
-                                if uuid_match:
-                                    uuid = uuid_match.group(1)
-                                else:
-                                    # Pattern 2: any long number.number format
-                                    uuid_match = re.search(r"['\"](\d{10,}\.\d+)['\"]", onclick)
-                                    if uuid_match:
-                                        uuid = uuid_match.group(1)
-
-                                if uuid:
-                                    logger.info(f"✓ Extracted UUID from onclick (fallback): {uuid}")
-
-                            # Fallback: Try all attributes
-                            if not uuid:
-                                for attr in ['data-uuid', 'data-call-id', 'data-id', 'id']:
-                                    uuid = button.get_attribute(attr)
-                                    if uuid and re.match(r'^\d{10,}\.\d+$', uuid):
-                                        logger.info(f"✓ Extracted UUID from {attr} (fallback): {uuid}")
-                                        break
-                                    uuid = None
-
-                            # Validate UUID format
+                            # One attribute read + one regex scan covers onclick and data-* attributes
+                            button_html = button.get_attribute('outerHTML')
+                            uuid = _extract_uuid(button_html)
+
                             if uuid:
-                                if not re.match(r'^\d{10,}\.\d+$', uuid):
-                                    logger.warning(f"⚠ Invalid UUID format '{uuid}' for call {did} (fallback) - skipping")
-                                    continue
                                 logger.info(f"✅ Valid UUID extracted (fallback): {uuid}")
                             else:
                                 logger.warning(f"⚠ Could not extract UUID for call {did} (fallback) - skipping")
-                                try:
-                                    button_html = button.get_attribute('outerHTML')
-                                    logger.debug(f"Button HTML: {button_html[:200]}")
-                                except:
-                                    pass
+                                logger.debug(f"Button HTML: {(button_html or '')[:200]}")
                                 continue  # Skip this call if no UUID found
                         except Exception as e:
                             logger.warning(f"⚠ UUID extraction error (fallback) for {did}: {e} - skipping")
@@ -486,44 +964,144 @@ def get_active_calls(driver):
                         # Create unique identifier
                         call_id = f"{termination}_{did}_{cli}"
 
-                        # Check if already processed
-                        if call_id not in processed_calls and did and cli:
+                        # Validate data - dedupe happens in monitor_calls
+                        if did and cli:
                             logger.info(f"Found call (fallback): Termination={termination}, DID={did}, CLI={cli}, Duration={duration}, UUID={uuid or 'N/A'}")
 
-                            calls.append({
-                                'id': call_id,
-                                'termination': termination,
-                                'did': did,
-                                'cli': cli,
-                                'duration': duration,
-                                'revenue': revenue,
-                                'uuid': uuid,
-                                'play_button': button,
-                                'row': row
-                            })
+                            flag, country_name = get_country_flag_and_name(did)
+                            _append_call(calls, (call_id, termination, did, cli, duration, revenue,
+                                                 uuid, flag, country_name, button, row))
 
                 except Exception as e:
                     logger.debug(f"Error processing button: {e}")
                     continue
 
+        # Save page source for debugging - only when nothing could be extracted
+        if not calls['id'] and logger.isEnabledFor(logging.DEBUG):
+            _dump_page_source(driver, 'page_debug.html')
+
         return calls
 
     except Exception as e:
         logger.error(f"Error getting active calls: {e}")
         import traceback
         logger.error(traceback.format_exc())
+        return _new_call_table()
+
+
+# Installs a MutationObserver on the call row's duration cell so polling only
+# reads a couple of page variables instead of re-querying the cell each time
+_WATCH_DURATION_JS = """
+const cell = arguments[0].cells[3];  // Termination, DID, CLI, Duration
+if (!cell) return false;
+if (window.__durObserver) window.__durObserver.disconnect();
+window.__durCell = cell;
+window.__dur = cell.innerText.trim();
+window.__durTs = performance.now();
+window.__durObserver = new MutationObserver(() => {
+    const text = cell.innerText.trim();
+    if (text !== window.__dur) {
+        window.__dur = text;
+        window.__durTs = performance.now();
+    }
+});
+window.__durObserver.observe(cell, {childList: true, characterData: true, subtree: true});
+return true;
+"""
+
+# [duration text, ms since it last changed, is the cell still in the page]
+_READ_DURATION_JS = """
+return [window.__dur, performance.now() - window.__durTs,
+        !!(window.__durCell && window.__durCell.isConnected)];
+"""
+
+
+class DurationStable:
+    """WebDriverWait condition - true once a call row's duration stops changing"""
+
+    def __init__(self, row, stable_for=6.0):
+        self.row = row
+        self.stable_for = stable_for
+        self.last_duration = None
+        self.row_gone = False
+        self._watching = False
+
+    def __call__(self, driver):
+        try:
+            if not self._watching:
+                self._watching = driver.execute_script(_WATCH_DURATION_JS, self.row)
+            current_duration, since_change_ms, attached = driver.execute_script(_READ_DURATION_JS)
+        except Exception as e:
+            logger.debug(f"Error checking duration: {e}")
+            current_duration, since_change_ms, attached = None, 0, False
+
+        if not attached or not current_duration:
+            if self.last_duration:
+                # Row disappeared - stop waiting, caller decides how to finish
+                self.row_gone = True
+                return True
+            return False
+
+        if current_duration != self.last_duration:
+            if self.last_duration:
+                logger.info(f"📹 Duration increased: {self.last_duration} → {current_duration}")
+            else:
+                logger.info(f"📹 Recording started, duration: {current_duration}")
+            self.last_duration = current_duration
+
+        # Measured with the page's own clock from the last observed mutation
+        return since_change_ms >= self.stable_for * 1000
+
+
+def _read_performance_logs(driver):
+    """Drain Chrome's performance log - empty unless CAPTURE_PERF_LOGS is enabled"""
+    if not CAPTURE_PERF_LOGS:
+        return []
+    try:
+        return driver.get_log('performance')
+    except Exception as e:
+        logger.debug(f"Could not read performance logs: {e}")
         return []
 
 
+def _wait_for_recording_response(driver, timeout=15, poll_interval=0.25):
+    """Wait until the recording endpoint has been fetched by the page.
+
+    Returns (resource_urls, logs) - everything read while waiting, so the caller
+    can still scan it for audio URLs.
+    """
+    resource_urls = []
+    logs = []
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            resource_urls.extend(driver.execute_script(_TAKE_RESOURCES_JS))
+        except Exception as e:
+            logger.debug(f"Could not read page resources: {e}")
+
+        entries = _read_performance_logs(driver)
+        logs.extend(entries)
+
+        if (any(ORANGECARRIER_SOUND_URL in url for url in resource_urls) or
+                any('"Network.responseReceived"' in entry.get('message', '') and
+                    ORANGECARRIER_SOUND_URL in entry.get('message', '') for entry in entries)):
+            logger.info("✓ Recording response received from server")
+            return resource_urls, logs
+
+        time.sleep(poll_interval)
+
+    logger.info(f"⏳ No recording response seen after {timeout}s, continuing")
+    return resource_urls, logs
+
+
 def extract_audio_url(driver, call):
     """Extract audio URL by clicking play button and monitoring duration field until it stops increasing"""
     try:
         logger.info(f"Processing call: DID={call['did']}, CLI={call['cli']}")
 
-        import json
-
-        # Clear previous logs
-        driver.get_log('performance')
+        # Clear previous logs and observed resources
+        _read_performance_logs(driver)
+        driver.execute_script(_TAKE_RESOURCES_JS)
 
         # Scroll to button and click
         driver.execute_script("arguments[0].scrollIntoView(true);", call['play_button'])
@@ -538,125 +1116,91 @@ def extract_audio_url(driver, call):
 
         logger.info("Play button clicked, monitoring duration field until recording completes...")
 
-        # Wait for initial recording to start
-        time.sleep(3)
-
         # Monitor the duration field - wait until it stops increasing
-        def get_current_duration():
-            """Get the current duration from the table row"""
-            try:
-                # Find the duration cell in the row (4th column: Termination, DID, CLI, Duration)
-                cells = call['row'].find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 4:
-                    duration_text = cells[3].text.strip()
-                    return duration_text
-            except:
-                pass
-            return None
-
-        last_duration = None
-        last_duration_numeric = 0
-        same_duration_count = 0
-        total_wait = 0
         max_wait = 120  # Maximum 2 minutes safety limit
-        check_interval = 2  # Check every 2 seconds
+        duration_stable = DurationStable(call['row'])
 
         logger.info("📹 Monitoring live duration field...")
 
-        while total_wait < max_wait:
-            try:
-                current_duration = get_current_duration()
-
-                if current_duration:
-                    if current_duration == last_duration:
-                        same_duration_count += 1
-                        logger.info(f"📹 Duration stable at {current_duration} (check {same_duration_count}/5)")
-
-                        # If duration hasn't changed for 5 consecutive checks (10 seconds), recording is done
-                        if same_duration_count >= 5:
-                            logger.info(f"✓ Recording completed! Final duration: {current_duration}")
-                            break
-                    else:
-                        # Duration increased, reset counter
-                        if last_duration:
-                            logger.info(f"📹 Duration increased: {last_duration} → {current_duration}")
-                        else:
-                            logger.info(f"📹 Recording started, duration: {current_duration}")
-                        last_duration = current_duration
-                        # Parse numeric duration
-                        try:
-                            last_duration_numeric = int(current_duration) if current_duration.isdigit() else 0
-                        except:
-                            last_duration_numeric = 0
-                        same_duration_count = 0
-                else:
-                    # Row disappeared or duration not found
-                    if last_duration:
-                        logger.info(f"⚠ Row disappeared early, last seen duration: {last_duration}")
-                        # IMPORTANT: Row disappears BEFORE recording is complete
-                        # Wait extra time based on last seen duration to capture full recording
-                        extra_wait = max(15, int(last_duration_numeric * 0.3) if last_duration_numeric > 0 else 15)
-                        logger.info(f"⏳ Waiting extra {extra_wait}s to ensure FULL recording is captured...")
-                        time.sleep(extra_wait)
-                        break
-                    else:
-                        logger.warning("⚠ Could not find duration field")
-
-                time.sleep(check_interval)
-                total_wait += check_interval
-
-            except Exception as e:
-                logger.debug(f"Error checking duration: {e}")
-                # Row might have disappeared
-                if last_duration:
-                    logger.info(f"⚠ Row disappeared (exception), last seen duration: {last_duration}")
-                    # Wait extra time for full recording
-                    extra_wait = max(15, int(last_duration_numeric * 0.3) if last_duration_numeric > 0 else 15)
-                    logger.info(f"⏳ Waiting extra {extra_wait}s to ensure FULL recording is captured...")
-                    time.sleep(extra_wait)
-                    break
-                time.sleep(check_interval)
-                total_wait += check_interval
-
-        if total_wait >= max_wait:
+        try:
+            WebDriverWait(driver, max_wait, poll_frequency=0.5).until(duration_stable)
+        except TimeoutException:
             logger.warning(f"⚠ Maximum wait time reached ({max_wait}s)")
 
-        # Wait extra 15 seconds to ensure audio file is fully processed on server
-        logger.info("⏳ Waiting 15s for server to finalize audio file...")
-        time.sleep(15)
+        last_duration = duration_stable.last_duration
+        if duration_stable.row_gone:
+            logger.info(f"⚠ Row disappeared early, last seen duration: {last_duration}")
+            # IMPORTANT: Row disappears BEFORE recording is complete
+            # Wait extra time based on last seen duration to capture full recording
+            last_duration_numeric = int(last_duration) if last_duration.isdigit() else 0
+            extra_wait = max(15, int(last_duration_numeric * 0.3) if last_duration_numeric > 0 else 15)
+            logger.info(f"⏳ Waiting extra {extra_wait}s to ensure FULL recording is captured...")
+            time.sleep(extra_wait)
+        elif last_duration:
+            logger.info(f"✓ Recording completed! Final duration: {last_duration}")
+
+        # Wait for the server to actually serve the recording instead of a fixed pad
+        logger.info("⏳ Waiting for server to finalize audio file...")
+        resource_urls, recording_logs = _wait_for_recording_response(driver)
 
         # Store the final duration for later use
         final_duration = last_duration
 
-        audio_urls = []
+        # Pick the URL while collecting: one naming a record/call/did/cli beats one
+        # that doesn't, and the latest candidate wins a tie
+        best_url = None
+        best_preferred = False
+
+        def add_candidate(url):
+            nonlocal best_url, best_preferred
+            preferred = bool(_PREFERRED_URL_RE.search(url))
+            if preferred or not best_preferred:
+                best_url, best_preferred = url, preferred
 
         # Look for audio/source elements
         try:
             audio_elements = driver.find_elements(By.TAG_NAME, "audio")
             for audio in audio_elements:
                 src = audio.get_attribute('src')
-                if src and 'notification' not in src.lower():
+                if src and not _NOTIFICATION_RE.search(src):
                     logger.info(f"Found audio element with source: {src}")
-                    audio_urls.append(src)
+                    add_candidate(src)
 
                 # Check for source children
                 sources = audio.find_elements(By.TAG_NAME, "source")
                 for source in sources:
                     src = source.get_attribute('src')
-                    if src and 'notification' not in src.lower():
+                    if src and not _NOTIFICATION_RE.search(src):
                         logger.info(f"Found source element: {src}")
-                        audio_urls.append(src)
+                        add_candidate(src)
         except Exception as e:
             logger.debug(f"No audio elements found: {e}")
 
+        # Responses reported by the page's PerformanceObserver - no log parsing needed
+        for url in resource_urls:
+            # Skip notification sounds
+            if _NOTIFICATION_RE.search(url):
+                continue
+
+            if _AUDIO_URL_RE.search(url):
+                logger.info(f"Found audio resource: {url}")
+                add_candidate(url)
+
         # Extract from performance logs
         try:
-            logs = driver.get_log('performance')
+            logs = recording_logs + _read_performance_logs(driver)
             logger.info(f"Checking {len(logs)} performance log entries...")
 
             for log in logs:
+                raw = log['message']
+                # Only network request/response events can carry the recording URL -
+                # skip everything else before paying for a JSON parse
+                if '"Network.response' not in raw and '"Network.request' not in raw:
+                    continue
+                if not _AUDIO_HINT_RE.search(raw):
+                    continue
                 try:
-                    log_entry = json.loads(log['message'])
+                    log_entry = _json_loads(raw)
                     message = log_entry.get('message', {})
                     method = message.get('method', '')
 
@@ -667,18 +1211,14 @@ def extract_audio_url(driver, call):
                         mime_type = response.get('mimeType', '')
 
                         # Skip notification sounds
-                        if 'notification' in url.lower():
+                        if _NOTIFICATION_RE.search(url):
                             continue
 
                         # Check if it's an audio file
-                        if ('audio' in mime_type.lower() or
-                            url.endswith(('.mp3', '.wav', '.ogg', '.m4a', '.webm')) or
-                            '/audio/' in url.lower() or
-                            'recording' in url.lower() or
-                            'call' in url.lower()):
+                        if 'audio' in mime_type or _AUDIO_URL_RE.search(url):
                             logger.info(f"Found audio URL from network log: {url}")
                             logger.info(f"MIME type: {mime_type}")
-                            audio_urls.append(url)
+                            add_candidate(url)
 
                     elif method == 'Network.requestWillBeSent':
                         params = message.get('params', {})
@@ -686,15 +1226,12 @@ def extract_audio_url(driver, call):
                         url = request.get('url', '')
 
                         # Skip notification sounds
-                        if 'notification' in url.lower():
+                        if _NOTIFICATION_RE.search(url):
                             continue
 
-                        if (url.endswith(('.mp3', '.wav', '.ogg', '.m4a', '.webm')) or
-                            '/audio/' in url.lower() or
-                            'recording' in url.lower() or
-                            'call' in url.lower()):
+                        if _AUDIO_URL_RE.search(url):
                             logger.info(f"Found audio request: {url}")
-                            audio_urls.append(url)
+                            add_candidate(url)
 
                 except Exception as e:
                     continue
@@ -702,21 +1239,17 @@ def extract_audio_url(driver, call):
             logger.error(f"Error parsing performance logs: {e}")
 
         # Return the audio URL and final duration
-        if audio_urls:
-            # Prefer URLs with 'record', 'call', or longer paths
-            for url in reversed(audio_urls):
-                if any(keyword in url.lower() for keyword in ['record', 'call', 'did', 'cli']):
-                    logger.info(f"Selected audio URL: {url}")
-                    logger.info(f"✓ Final monitored duration: {final_duration}")
-                    return (url, final_duration)
-            # Otherwise return the last one
-            logger.info(f"Selected last audio URL: {audio_urls[-1]}")
+        if best_url:
+            if best_preferred:
+                logger.info(f"Selected audio URL: {best_url}")
+            else:
+                logger.info(f"Selected last audio URL: {best_url}")
             logger.info(f"✓ Final monitored duration: {final_duration}")
-            return (audio_urls[-1], final_duration)
+            return (best_url, final_duration)
 
         # Save page source for debugging
-        with open(f'call_{call["id"]}_debug.html', 'w', encoding='utf-8') as f:
-            f.write(driver.page_source)
+        if DUMP_DEBUG_HTML and _claim_debug_dump():
+            _dump_page_source(driver, f'call_{call["id"]}_debug.html', keep=1)
 
         logger.warning(f"Could not extract audio URL for call {call['id']}")
         return (None, None)
@@ -728,18 +1261,166 @@ def extract_audio_url(driver, call):
         return (None, None)
 
 
+# One pooled HTTP session for every download - reuses warm TLS connections
+# instead of a fresh handshake per request
+http_session = requests.Session()
+http_session.mount('https://', HTTPAdapter(
+    pool_connections=HTTP_POOL_CONNECTIONS,
+    pool_maxsize=HTTP_POOL_MAXSIZE,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+
+
+@lru_cache(maxsize=1)
+def get_api_client():
+    """Shared async client for the sound API - all calls' polls and downloads run
+    as coroutines on the background loop, multiplexed over HTTP/2 when available"""
+    transport = httpx.AsyncHTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=API_MAX_CONNECTIONS),
+        retries=2
+    )
+    # No pool timeout - a burst of calls queues for a connection instead of failing.
+    # Redirects are followed like requests did (CDN hops, expired session -> /login)
+    return httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(5, pool=None),
+                             follow_redirects=True)
+
+
+# Cookies are only re-read from Selenium on page loads. A download that gets
+# 401/403 sets this event; monitor_calls then reloads the page and copies
+# fresh cookies over, which clears it again.
+COOKIE_REFRESH_EVENT = threading.Event()
+_AUTH_FAILED_STATUSES = (401, 403)
+
+
+def _is_auth_failure(response):
+    """True if the sound API refused our session (401/403 or bounced to the login page)"""
+    return response.status_code in _AUTH_FAILED_STATUSES or '/login' in response.url.path
+
+
+def update_session_cookies(cookies):
+    """Copy Selenium cookies into the shared HTTP clients"""
+    api_client = get_api_client()
+    for cookie in cookies:
+        http_session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+        api_client.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain') or '')
+    COOKIE_REFRESH_EVENT.clear()
+
+
+async def _wait_for_fresh_cookies(call_id, timeout=15):
+    """Ask monitor_calls for fresh Selenium cookies and wait until they're in"""
+    logger.warning(f"🔑 [{call_id}] Sound API rejected the session - requesting fresh cookies...")
+    COOKIE_REFRESH_EVENT.set()
+    deadline = time.monotonic() + timeout
+    while COOKIE_REFRESH_EVENT.is_set() and time.monotonic() < deadline:
+        await asyncio.sleep(0.2)
+
+
+def _headers(accept_encoding='gzip, deflate'):
+    """Browser-like headers for the sound API with the given Accept-Encoding"""
+    return {
+        'User-Agent': 'Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Mobile Safari/537.36',
+        'Referer': ORANGECARRIER_CALLS_URL,
+        'Accept': '*/*',
+        'Accept-Encoding': accept_encoding,
+        'sec-fetch-site': 'same-origin',
+        'sec-fetch-mode': 'no-cors',
+        'sec-fetch-dest': 'audio'
+    }
+
+
+# Built once instead of per request. Every sound endpoint request - HEAD polls,
+# the Range GET fallback and the download - asks for identity like Chrome's media
+# requests, so the server keeps Range support and Content-Length is the real
+# file size. Compression via _headers() is for non-audio endpoints only.
+SOUND_HEADERS = _headers(accept_encoding='identity;q=1, *;q=0')
+
+# DIDs whose sound endpoint answers HEAD with 200 but no Content-Length, or
+# 405/501 - remembered so their polls go straight to the Range GET fallback
+_head_unsupported_dids = set()
+
+
+async def _recording_size(api_url, did, headers):
+    """Current size in bytes of the recording on the server (0 if unknown, None if unauthorized)"""
+    client = get_api_client()
+    if did not in _head_unsupported_dids:
+        response = await client.head(api_url, headers=headers)
+        if _is_auth_failure(response):
+            return None
+        content_length = response.headers.get('Content-Length')
+        if response.status_code == 200 and content_length:
+            return int(content_length)
+        if response.status_code not in (200, 405, 501):
+            # Transient (e.g. 404/5xx while the recording is still being created)
+            return 0
+        # HEAD really isn't usable for this DID - no length, or not allowed
+        _head_unsupported_dids.add(did)
+
+    # Fallback: 2-byte Range GET, total size comes from Content-Range
+    range_headers = headers.copy()
+    range_headers['Range'] = 'bytes=0-1'
+    async with client.stream('GET', api_url, headers=range_headers) as response:
+        if _is_auth_failure(response):
+            return None
+        if response.status_code not in [200, 206]:
+            return 0
+        match = _CONTENT_RANGE_TOTAL_RE.search(response.headers.get('Content-Range', ''))
+        if match:
+            return int(match.group(1))
+        return int(response.headers.get('Content-Length', 0))
+
+
+def _stream_to_file(response, filename):
+    """Write a streamed response body to disk chunk by chunk, returns bytes written"""
+    expected_size = int(response.headers.get('Content-Length', 0))
+    with open(filename, 'wb') as f:
+        if expected_size and hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(f.fileno(), 0, expected_size)
+        try:
+            # iter_content hands over each chunk as it arrives, so bytes read
+            # before a stall are kept (raw.read would buffer up a full block)
+            for chunk in response.iter_content(1 << 16):
+                f.write(chunk)
+        finally:
+            # Drop any preallocated space beyond what actually arrived
+            f.truncate()
+        return f.tell()
+
+
+async def _astream_to_file(response, filename, stall_timeout=None):
+    """Async twin of _stream_to_file for httpx responses, returns bytes written
+
+    With stall_timeout, raises TimeoutError once no chunk arrives for that long
+    (bytes already received stay in the file).
+    """
+    expected_size = int(response.headers.get('Content-Length', 0))
+    with open(filename, 'wb') as f:
+        if expected_size and hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(f.fileno(), 0, expected_size)
+        try:
+            # Chunks are handed over as they arrive (a fixed chunk size would
+            # buffer them and lose the tail on a stall); local disk writes are
+            # cheap enough to do on the loop
+            chunks = response.aiter_bytes()
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(anext(chunks), stall_timeout)
+                except StopAsyncIteration:
+                    break
+                f.write(chunk)
+        finally:
+            # Drop any preallocated space beyond what actually arrived
+            f.truncate()
+        return f.tell()
+
+
 def download_audio(driver, audio_url, call_id):
     """Download audio file from URL using Selenium session cookies"""
     try:
         logger.info(f"Downloading audio from: {audio_url}")
 
-        # Get cookies from Selenium driver
-        cookies = driver.get_cookies()
-
-        # Create a session and transfer cookies
-        session = requests.Session()
-        for cookie in cookies:
-            session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+        # Transfer cookies from Selenium driver
+        update_session_cookies(driver.get_cookies())
 
         # Copy headers from the browser
         headers = {
@@ -748,24 +1429,23 @@ def download_audio(driver, audio_url, call_id):
         }
 
         # Download the audio with authenticated session
-        response = session.get(audio_url, headers=headers, timeout=30)
-        response.raise_for_status()
-
-        # Determine file extension
-        content_type = response.headers.get('Content-Type', '')
-        if 'audio/mpeg' in content_type or 'mp3' in audio_url:
-            ext = 'mp3'
-        elif 'audio/wav' in content_type or 'wav' in audio_url:
-            ext = 'wav'
-        elif 'audio/ogg' in content_type or 'ogg' in audio_url:
-            ext = 'ogg'
-        else:
-            ext = 'mp3'  # default
+        with http_session.get(audio_url, headers=headers, timeout=30, stream=True) as response:
+            response.raise_for_status()
+
+            # Determine file extension
+            content_type = response.headers.get('Content-Type', '')
+            if 'audio/mpeg' in content_type or 'mp3' in audio_url:
+                ext = 'mp3'
+            elif 'audio/wav' in content_type or 'wav' in audio_url:
+                ext = 'wav'
+            elif 'audio/ogg' in content_type or 'ogg' in audio_url:
+                ext = 'ogg'
+            else:
+                ext = 'mp3'  # default
 
-        # Save to file
-        filename = f"call_{call_id}.{ext}"
-        with open(filename, 'wb') as f:
-            f.write(response.content)
+            # Save to file
+            filename = f"call_{call_id}.{ext}"
+            _stream_to_file(response, filename)
 
         logger.info(f"Audio saved to: {filename}")
         return filename
@@ -777,76 +1457,52 @@ def download_audio(driver, audio_url, call_id):
         return None
 
 
-def download_audio_via_api(session_cookies, did, uuid, call_id, wait_for_completion=True):
+async def download_audio_via_api(did, uuid, call_id, wait_for_completion=True):
     """Download audio directly via API - ULTRA FAST with smart wait!"""
     try:
         # Construct API URL based on discovered endpoint
-        api_url = f"https://www.orangecarrier.com/live/calls/sound?did={did}&uuid={uuid}"
+        api_url = f"{ORANGECARRIER_SOUND_URL}?did={did}&uuid={uuid}"
+        cookies_refreshed = False  # Fresh cookies are requested at most once per call
 
         if wait_for_completion:
             # 🔥 ULTRA-FAST INTELLIGENT WAIT: Minimal checks, instant download
             logger.info(f"⚡ [{call_id}] Smart wait for UUID {uuid}...")
 
-            session = requests.Session()
-            for cookie in session_cookies:
-                session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
-
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Mobile Safari/537.36',
-                'Referer': 'https://www.orangecarrier.com/live/calls',
-                'Accept': '*/*',
-                'Accept-Encoding': 'identity;q=1, *;q=0',
-                'sec-fetch-site': 'same-origin',
-                'sec-fetch-mode': 'no-cors',
-                'sec-fetch-dest': 'audio'
-            }
-
             last_size = 0
             stable_count = 0
             max_wait = 30  # 30 seconds max
             total_waited = 0
-            check_interval = 1  # Check every 1 second
-            min_stable_checks = 3  # ⚡ INSTANT: Only 3 checks = 3 seconds!
+            check_interval = 0.5  # HEAD is cheap - check twice a second
+            min_stable_checks = 6  # ⚡ INSTANT: size unchanged for 3 seconds!
 
             while total_waited < max_wait:
                 try:
                     # Lightning-fast size check
-                    range_headers = headers.copy()
-                    range_headers['Range'] = 'bytes=0-1'
-
-                    response = session.get(api_url, headers=range_headers, timeout=5, stream=True)
-
-                    if response.status_code in [200, 206]:
-                        content_range = response.headers.get('Content-Range')
-                        if content_range:
-                            import re
-                            match = re.search(r'/(\d+)$', content_range)
-                            if match:
-                                current_size = int(match.group(1))
-                            else:
-                                current_size = int(response.headers.get('Content-Length', 0))
-                        else:
-                            current_size = int(response.headers.get('Content-Length', 0))
-
-                        response.close()
+                    current_size = await _recording_size(api_url, did, SOUND_HEADERS)
+                    if current_size is None:
+                        if not cookies_refreshed:
+                            await _wait_for_fresh_cookies(call_id)
+                            cookies_refreshed = True
+                            continue
+                        current_size = 0
 
-                        if current_size > 0:
-                            if current_size == last_size:
-                                stable_count += 1
+                    if current_size > 0:
+                        if current_size == last_size:
+                            stable_count += 1
 
-                                # ⚡ ULTRA FAST: Complete after 3 checks (3 seconds!)
-                                if stable_count >= min_stable_checks:
-                                    logger.info(f"⚡ [{call_id}] INSTANT complete! Size: {current_size} bytes")
-                                    break
-                            else:
-                                last_size = current_size
-                                stable_count = 0
+                            # ⚡ ULTRA FAST: Complete after 3 stable seconds!
+                            if stable_count >= min_stable_checks:
+                                logger.info(f"⚡ [{call_id}] INSTANT complete! Size: {current_size} bytes")
+                                break
+                        else:
+                            last_size = current_size
+                            stable_count = 0
 
-                    time.sleep(check_interval)
+                    await asyncio.sleep(check_interval)
                     total_waited += check_interval
 
                 except Exception as e:
-                    time.sleep(check_interval)
+                    await asyncio.sleep(check_interval)
                     total_waited += check_interval
 
             # ⚡ ZERO BUFFER - Download NOW!
@@ -854,90 +1510,158 @@ def download_audio_via_api(session_cookies, did, uuid, call_id, wait_for_complet
         # Download INSTANTLY
         logger.info(f"📥 [{call_id}] Downloading...")
 
-        session = requests.Session()
-        for cookie in session_cookies:
-            session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
-
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Mobile Safari/537.36',
-            'Referer': 'https://www.orangecarrier.com/live/calls',
-            'Accept': '*/*',
-            'Accept-Encoding': 'identity;q=1, *;q=0',
-            'sec-fetch-site': 'same-origin',
-            'sec-fetch-mode': 'no-cors',
-            'sec-fetch-dest': 'audio'
-        }
+        # Download audio file in one streaming GET - if the server keeps appending
+        # to a still-growing recording, read until bytes stop arriving
+        download_timeout = httpx.Timeout(DOWNLOAD_READ_TIMEOUT, connect=5, pool=None)
+        while True:
+            async with get_api_client().stream('GET', api_url, headers=SOUND_HEADERS,
+                                               timeout=download_timeout) as response:
+                # Session expired mid-call - retry once with fresh cookies
+                if _is_auth_failure(response) and not cookies_refreshed:
+                    await response.aclose()
+                    await _wait_for_fresh_cookies(call_id)
+                    cookies_refreshed = True
+                    continue
+                response.raise_for_status()
+
+                # Check if we got audio
+                content_type = response.headers.get('Content-Type', '')
+                if 'audio' not in content_type:
+                    logger.warning(f"⚠ API returned non-audio content: {content_type}")
+                    return None
+
+                # Determine extension
+                if 'audio/wav' in content_type or 'wav' in api_url:
+                    ext = 'wav'
+                elif 'audio/mpeg' in content_type or 'mp3' in api_url:
+                    ext = 'mp3'
+                else:
+                    ext = 'wav'
+
+                # Stream straight to file
+                filename = f"call_{call_id}.{ext}"
+                expected_size = int(response.headers.get('Content-Length', 0))
+                # Only an open-ended stream can still be growing - a fixed-length
+                # body just gets the regular read timeout
+                stall_timeout = None if expected_size else DOWNLOAD_STALL_TIMEOUT
+                try:
+                    file_size = await _astream_to_file(response, filename, stall_timeout)
+                except TimeoutError:
+                    # A stalled open-ended stream is the finished recording
+                    file_size = os.path.getsize(filename)
+                    if not file_size:
+                        os.remove(filename)
+                        raise
+                    logger.info(f"⏸ [{call_id}] Stream idle for {DOWNLOAD_STALL_TIMEOUT}s - recording complete")
+                except httpx.TimeoutException:
+                    os.remove(filename)
+                    raise
 
-        # Download audio file
-        response = session.get(api_url, headers=headers, timeout=60)
-        response.raise_for_status()
+            break
 
-        # Check if we got audio
-        content_type = response.headers.get('Content-Type', '')
-        if 'audio' not in content_type:
-            logger.warning(f"⚠ API returned non-audio content: {content_type}")
+        if expected_size and file_size < expected_size:
+            logger.warning(f"⚠ [{call_id}] Incomplete download: {file_size}/{expected_size} bytes")
+            os.remove(filename)
             return None
 
-        # Determine extension
-        if 'audio/wav' in content_type or 'wav' in api_url:
-            ext = 'wav'
-        elif 'audio/mpeg' in content_type or 'mp3' in api_url:
-            ext = 'mp3'
-        else:
-            ext = 'wav'
-
-        # Save to file
-        filename = f"call_{call_id}.{ext}"
-        with open(filename, 'wb') as f:
-            f.write(response.content)
-
-        file_size = len(response.content)
         logger.info(f"✅ [{call_id}] Downloaded: {filename} ({file_size} bytes)")
         return filename
 
     except Exception as e:
-        logger.error(f"❌ [{call_id}] Download failed: {e}")
+        logger.error(f"❌ [{call_id}] Download failed: {e!r}")
         return None
 
 
 
 
-async def send_instant_notification(call_info):
-    """Send instant notification when call is detected"""
-    try:
-        bot = Bot(token=TELEGRAM_BOT_TOKEN)
+# One long-lived event loop for all Telegram traffic - creating a loop per send
+# would also throw away the Bot's pooled connections every time
+_event_loop = None
+_event_loop_lock = threading.Lock()
 
-        # Get country flag and name from DID (actual number)
-        flag, country_name = get_country_flag_and_name(call_info['did'])
 
-        # Ensure phone number has + prefix
-        phone_display = call_info['did'] if call_info['did'].startswith('+') else f"+{call_info['did']}"
+def get_event_loop():
+    """Start (once) and return the background asyncio loop"""
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = asyncio.new_event_loop()
+            threading.Thread(target=_event_loop.run_forever, name="event-loop", daemon=True).start()
+        return _event_loop
+
+
+def run_async(coro):
+    """Schedule a coroutine on the background loop - returns a concurrent.futures.Future"""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+
+@lru_cache(maxsize=1)
+def get_bot():
+    """Shared Telegram Bot whose HTTP client reuses connections (HTTP/2 when available)"""
+    request = HTTPXRequest(
+        connection_pool_size=TELEGRAM_POOL_SIZE,
+        http_version=TELEGRAM_HTTP_VERSION,
+        # Shared by every upload - a burst beyond the pool size queues for a
+        # connection instead of failing with TimedOut after 1s
+        pool_timeout=None,
+        media_write_timeout=TELEGRAM_MEDIA_WRITE_TIMEOUT
+    )
+    return Bot(token=TELEGRAM_BOT_TOKEN, request=request)
+
+
+# Telegram's 429 "retry_after" applies to the whole bot, so when one send hits
+# it every other send waits too instead of hammering the API in parallel
+_telegram_pause_until = 0.0
+_telegram_pause_lock = threading.Lock()
+
+
+async def telegram_send(method, **kwargs):
+    """Call a Bot method, holding ALL senders back while a Telegram retry_after is active"""
+    global _telegram_pause_until
+
+    for attempt in range(1, TELEGRAM_MAX_RETRIES + 1):
+        delay = _telegram_pause_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
 
-        # Mask phone number for privacy (show first 3 and last 3 digits only)
         try:
-            parsed = phonenumbers.parse(phone_display, None)
-            country_code = f"+{parsed.country_code}"
-            national_number = str(parsed.national_number)
-            if len(national_number) > 3:
-                masked_national = '*' * (len(national_number) - 3) + national_number[-3:]
-            else:
-                masked_national = national_number
-            masked_phone = country_code + masked_national
-        except:
-            if len(phone_display) > 7:
-                masked_phone = phone_display[:4] + '******' + phone_display[-3:]
-            else:
-                masked_phone = phone_display
+            return await method(**kwargs)
+        except RetryAfter as e:
+            if attempt == TELEGRAM_MAX_RETRIES:
+                raise
+            with _telegram_pause_lock:
+                _telegram_pause_until = max(_telegram_pause_until, time.monotonic() + e.retry_after)
+            logger.warning(f"⏳ Telegram rate limit hit, pausing all sends for {e.retry_after}s (attempt {attempt}/{TELEGRAM_MAX_RETRIES})")
+
+
+async def send_instant_notification(calls):
+    """Send one instant notification for the calls detected in the same batch window"""
+    try:
+        bot = get_bot()
 
-        message = f"📞 𝙽𝚎𝚠 𝚌𝚊𝚕𝚕 𝚛𝚎𝚌𝚎𝚒𝚟𝚎 𝚠𝚊𝚒𝚝𝚒𝚗𝚐\n\n{flag} <code>{masked_phone}</code>"
+        lines = []
+        for call_info in calls:
+            # Get country flag from DID (actual number)
+            flag, country_name = get_country_flag_and_name(call_info['did'])
 
-        sent_message = await bot.send_message(
+            # Mask phone number for privacy (show country code and last 3 digits only)
+            masked_phone = mask_phone_number(call_info['did'])
+            lines.append(f"{flag} <code>{masked_phone}</code>")
+
+        if len(calls) == 1:
+            header = "📞 𝙽𝚎𝚠 𝚌𝚊𝚕𝚕 𝚛𝚎𝚌𝚎𝚒𝚟𝚎 𝚠𝚊𝚒𝚝𝚒𝚗𝚐"
+        else:
+            header = f"📞 {len(calls)} 𝙽𝚎𝚠 𝚌𝚊𝚕𝚕𝚜 𝚛𝚎𝚌𝚎𝚒𝚟𝚎 𝚠𝚊𝚒𝚝𝚒𝚗𝚐"
+        message = header + "\n\n" + "\n".join(lines)
+
+        sent_message = await telegram_send(
+            bot.send_message,
             chat_id=TELEGRAM_CHAT_ID,
             text=message,
             parse_mode=ParseMode.HTML
         )
 
-        logger.info(f"Instant notification sent for DID {call_info['did']} ({flag} {country_name})")
+        logger.info(f"Instant notification sent for {len(calls)} call(s): {', '.join(c['did'] for c in calls)}")
 
         # Store message_id to delete it later
         return sent_message.message_id
@@ -949,37 +1673,114 @@ async def send_instant_notification(call_info):
         return None
 
 
-async def send_to_telegram(audio_file, call_info, notification_msg_id=None):
-    """Send audio file to Telegram group as video with caption"""
+# Instant notifications are batched: calls detected within
+# NOTIFICATION_BATCH_WINDOW share one Telegram message, which is deleted once
+# every call in it has been forwarded. Only touched from the event loop thread.
+_pending_notifications = []  # (call, future of the message id) awaiting the next flush
+_notification_batches = {}  # message id -> calls in it not forwarded yet
+_flush_tasks = set()  # Strong refs - the loop itself only keeps weak ones to tasks
+
+
+def queue_instant_notification(call):
+    """Add a call to the next batched notification - returns a future of its message id"""
+    if not _pending_notifications:
+        # First call of a new batch window
+        task = asyncio.ensure_future(_flush_notifications())
+        _flush_tasks.add(task)
+        task.add_done_callback(_flush_tasks.discard)
+
+    future = asyncio.get_running_loop().create_future()
+    _pending_notifications.append((call, future))
+    return future
+
+
+async def _flush_notifications():
+    """Wait out the batch window, then send the gathered calls (one message per chunk)"""
+    await asyncio.sleep(NOTIFICATION_BATCH_WINDOW)
+
+    batch = _pending_notifications[:]
+    _pending_notifications.clear()
+
+    try:
+        for start in range(0, len(batch), MAX_CALLS_PER_NOTIFICATION):
+            chunk = batch[start:start + MAX_CALLS_PER_NOTIFICATION]
+            msg_id = await send_instant_notification([call for call, _ in chunk])
+            if msg_id is not None:
+                _notification_batches[msg_id] = len(chunk)
+            for _, future in chunk:
+                future.set_result(msg_id)
+    finally:
+        # Never leave a call waiting on a notification that won't come
+        for _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+
+async def release_notification(notification, forwarded):
+    """Drop a finished call from its notification, deleting the message after the last forward"""
+    msg_id = await notification
+    if msg_id not in _notification_batches:
+        return
+
+    if not forwarded:
+        # Keep the message - it's the only trace of the call that failed
+        del _notification_batches[msg_id]
+        return
+
+    _notification_batches[msg_id] -= 1
+    if _notification_batches[msg_id] > 0:
+        return
+
+    del _notification_batches[msg_id]
+    try:
+        await telegram_send(get_bot().delete_message, chat_id=TELEGRAM_CHAT_ID, message_id=msg_id)
+        logger.info(f"Instant notification {msg_id} deleted")
+    except Exception as e:
+        logger.debug(f"Could not delete notification {msg_id}: {e}")
+
+
+async def convert_to_voice(audio_file, call_id):
+    """Re-encode a recording to OGG/Opus for sendVoice, or return None if ffmpeg fails"""
+    voice_path = Path(audio_file).with_suffix('.ogg')
+    try:
+        process = await asyncio.create_subprocess_exec(
+            'ffmpeg', '-y', '-v', 'error',
+            '-i', audio_file,
+            '-vn', '-c:a', 'libopus', '-b:a', VOICE_BITRATE,
+            str(voice_path),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            _, stderr = await asyncio.wait_for(process.communicate(), timeout=FFMPEG_TIMEOUT)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+
+        if process.returncode != 0:
+            raise RuntimeError(stderr.decode(errors='replace').strip() or f"exit code {process.returncode}")
+        return voice_path
+
+    except Exception as e:
+        logger.warning(f"⚠ [{call_id}] Voice conversion failed ({e!r}), sending as a document")
+        if voice_path.exists():
+            voice_path.unlink()
+        return None
+
+
+async def send_to_telegram(audio_file, call_info):
+    """Send audio file to Telegram group with caption"""
     try:
         logger.info(f"[{call_info['id']}] Sending FULL recording to Telegram...")
 
-        bot = Bot(token=TELEGRAM_BOT_TOKEN)
+        bot = get_bot()
 
         # Get country flag and name from DID (actual number)
         flag, country_name = get_country_flag_and_name(call_info['did'])
 
         # Format DID number - show country code and last 3 digits only
-        phone_display = call_info['did'] if call_info['did'].startswith('+') else f"+{call_info['did']}"
-
-        # Extract country code and mask rest except last 3 digits
-        try:
-            parsed = phonenumbers.parse(phone_display, None)
-            country_code = f"+{parsed.country_code}"
-            # Get the number part without country code
-            national_number = str(parsed.national_number)
-            # Mask all digits except last 3
-            if len(national_number) > 3:
-                masked_national = '*' * (len(national_number) - 3) + national_number[-3:]
-            else:
-                masked_national = national_number
-            masked_phone = country_code + masked_national
-        except:
-            # Fallback if parsing fails
-            if len(phone_display) > 7:
-                masked_phone = phone_display[:4] + '******' + phone_display[-3:]
-            else:
-                masked_phone = phone_display
+        masked_phone = mask_phone_number(call_info['did'])
 
         # Get Bangladesh time
         bd_timezone = pytz.timezone('Asia/Dhaka')
@@ -988,36 +1789,21 @@ async def send_to_telegram(audio_file, call_info, notification_msg_id=None):
         time_str = bd_time.strftime('%I:%M:%S')
         period = bd_time.strftime('%p')
 
-        # 🔥 FIX: Get ACTUAL duration from audio file using ffprobe
+        # 🔥 FIX: Get ACTUAL duration from the audio file headers (in-process, no ffprobe)
         duration_num = 30  # Default fallback
         try:
             logger.info(f"🎵 Detecting ACTUAL duration from audio file: {audio_file}")
 
-            # Use ffprobe to get exact audio duration
-            result = subprocess.run([
-                'ffprobe', '-v', 'error', '-show_entries', 
-                'format=duration', '-of', 
-                'default=noprint_wrappers=1:nokey=1', audio_file
-            ], capture_output=True, text=True, timeout=10)
-
-            if result.returncode == 0:
-                duration_str = result.stdout.strip()
-                if duration_str:
-                    duration_num = int(float(duration_str))
-                    logger.info(f"✅ ACTUAL audio duration detected: {duration_num} seconds")
-                else:
-                    logger.warning(f"⚠ ffprobe returned empty, using default 30s")
+            audio_info = await asyncio.to_thread(MutagenFile, audio_file)
+            if audio_info is not None and audio_info.info.length:
+                duration_num = int(audio_info.info.length)
+                logger.info(f"✅ ACTUAL audio duration detected: {duration_num} seconds")
             else:
-                logger.warning(f"⚠ ffprobe failed: {result.stderr}, using default 30s")
+                logger.warning(f"⚠ Unknown audio format, using default 30s")
 
-        except subprocess.TimeoutExpired:
-            logger.warning(f"⚠ ffprobe timeout, using default 30s")
-        except FileNotFoundError:
-            logger.warning(f"⚠ ffprobe not found, using default 30s")
         except Exception as e:
             logger.warning(f"⚠ Duration detection error: {e}, using default 30s")
 
-
         # Prepare caption with bold labels and code tags for monospace values
         caption = f"📞 <b>𝙽𝚎𝚠 𝚅𝚘𝚒𝚌𝚎 𝙽𝚘𝚝𝚎 𝙲𝚘𝚖𝚒𝚗𝚐</b>\n\n"
         caption += f"{flag} <b>𝙲𝚘𝚞𝚗𝚝𝚛𝚢:</b> <code>{country_name}</code>\n"
@@ -1036,65 +1822,36 @@ async def send_to_telegram(audio_file, call_info, notification_msg_id=None):
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
 
-        # Convert audio to video with black screen background (320x320)
-        video_file = audio_file.replace('.mp3', '.mp4').replace('.wav', '.mp4').replace('.ogg', '.mp4')
+        # Send the recording as a playable audio/voice message - no black-screen
+        # video encode. sendAudio only supports MP3/M4A, so anything else (the
+        # API's WAV) becomes an OGG/Opus voice note with one audio-only ffmpeg
+        # call; the file goes as a document only if that conversion fails.
+        # Path (not an open file) so a rate-limit retry re-reads the file
+        audio_path = Path(audio_file)
+        voice_path = None
+        if audio_path.suffix.lower() in TELEGRAM_AUDIO_SUFFIXES:
+            send_method, media = bot.send_audio, {'audio': audio_path, 'duration': duration_num}
+        else:
+            voice_path = await convert_to_voice(audio_file, call_info['id'])
+            if voice_path:
+                send_method, media = bot.send_voice, {'voice': voice_path, 'duration': duration_num}
+            else:
+                send_method, media = bot.send_document, {'document': audio_path}
 
         try:
-            # Create video with black screen using ffmpeg (320x320 size)
-            subprocess.run([
-                'ffmpeg', '-y',
-                '-f', 'lavfi', '-i', f'color=c=black:s=320x320:d={duration_num}',
-                '-i', audio_file,
-                '-shortest',
-                '-c:v', 'libx264',
-                '-c:a', 'aac',
-                '-strict', 'experimental',
-                video_file
-            ], check=True, capture_output=True)
-
-            # Send video with black background
-            with open(video_file, 'rb') as video:
-                await bot.send_video(
-                    chat_id=TELEGRAM_CHAT_ID,
-                    video=video,
-                    caption=caption,
-                    width=320,
-                    height=320,
-                    duration=duration_num,
-                    supports_streaming=True,
-                    reply_markup=reply_markup,
-                    parse_mode=ParseMode.HTML
-                )
-
-            # Clean up video file
-            if os.path.exists(video_file):
-                os.remove(video_file)
+            await telegram_send(
+                send_method,
+                chat_id=TELEGRAM_CHAT_ID,
+                caption=caption,
+                reply_markup=reply_markup,
+                parse_mode=ParseMode.HTML,
+                **media
+            )
+        finally:
+            if voice_path and voice_path.exists():
+                voice_path.unlink()
 
-        except Exception as e:
-            logger.error(f"Error creating video with black screen: {e}")
-            # Fallback to sending audio as video if ffmpeg fails
-            with open(audio_file, 'rb') as video:
-                await bot.send_video(
-                    chat_id=TELEGRAM_CHAT_ID,
-                    video=video,
-                    caption=caption,
-                    width=320,
-                    height=320,
-                    duration=duration_num,
-                    supports_streaming=True,
-                    reply_markup=reply_markup,
-                    parse_mode=ParseMode.HTML
-                )
-
-        logger.info(f"✅ [{call_info['id']}] FULL recording video sent successfully!")
-
-        # Delete the instant notification message AFTER successful send
-        if notification_msg_id:
-            try:
-                await bot.delete_message(chat_id=TELEGRAM_CHAT_ID, message_id=notification_msg_id)
-                logger.info(f"[{call_info['id']}] Instant notification deleted")
-            except Exception as e:
-                logger.debug(f"[{call_info['id']}] Could not delete notification: {e}")
+        logger.info(f"✅ [{call_info['id']}] FULL recording audio sent successfully!")
 
         # Delete the temporary audio file
         if os.path.exists(audio_file):
@@ -1109,7 +1866,19 @@ async def send_to_telegram(audio_file, call_info, notification_msg_id=None):
         return False
 
 
-def process_single_call(session_cookies, call, notification_msg_id=None):
+async def process_single_call(call):
+    """Notify about a call, forward its recording, then retire the notification"""
+    # Instant notification goes out with the rest of this poll's new calls
+    notification = queue_instant_notification(call)
+
+    forwarded = await _forward_call(call)
+
+    # Delete the instant notification message AFTER successful send
+    await release_notification(notification, forwarded)
+    return forwarded
+
+
+async def _forward_call(call):
     """Process a single call using API - NO driver needed, fully parallel with FULL recording!"""
     call_id = call['id']
 
@@ -1123,8 +1892,7 @@ def process_single_call(session_cookies, call, notification_msg_id=None):
 
             # Download FULL recording via API - waits for completion automatically!
             logger.info(f"⏬ [{call_id}] Starting intelligent download system...")
-            audio_file = download_audio_via_api(
-                session_cookies,
+            audio_file = await download_audio_via_api(
                 call['did'],
                 call['uuid'],
                 call_id,
@@ -1134,9 +1902,9 @@ def process_single_call(session_cookies, call, notification_msg_id=None):
             if audio_file:
                 logger.info(f"✓ [{call_id}] Audio file downloaded successfully: {audio_file}")
 
-                # Send to Telegram as video
+                # Send to Telegram as audio
                 logger.info(f"📤 [{call_id}] Uploading to Telegram...")
-                success = asyncio.run(send_to_telegram(audio_file, call, notification_msg_id))
+                success = await send_to_telegram(audio_file, call)
 
                 if success:
                     logger.info(f"✅✅✅ [{call_id}] FULL recording forwarded successfully to Telegram!")
@@ -1158,68 +1926,99 @@ def process_single_call(session_cookies, call, notification_msg_id=None):
         return False
 
 
-def monitor_calls(driver):
+def _relogin(driver):
+    """Log an expired browser session back in and return to the calls page"""
+    logger.warning("⚠ Session expired - logging in again...")
+    if not login_to_orangecarrier(driver):
+        raise RuntimeError("Re-login failed")
+    save_session_cookies(driver)
+    driver.get(ORANGECARRIER_CALLS_URL)
+
+
+def _replace_browser(pool, driver, delay=10, max_delay=300):
+    """Recycle a failed browser, retrying with backoff until a fresh one is on the calls page"""
+    while True:
+        time.sleep(delay)
+        try:
+            if driver is not None:
+                try:
+                    pool.release(driver, broken=True)
+                finally:
+                    # Discarded even if its replacement failed to launch
+                    driver = None
+            driver = pool.acquire()
+            driver.get(ORANGECARRIER_CALLS_URL)
+            return driver
+        except Exception as e:
+            delay = min(delay * 2, max_delay)
+            logger.error(f"⚠ Browser relaunch failed: {e} - retrying in {delay}s")
+
+
+def monitor_calls(pool):
     """Main monitoring loop - UNLIMITED parallel processing with API!"""
     logger.info("🚀 Starting call monitoring with UNLIMITED parallel processing via API...")
 
+    driver = pool.acquire()
+
     # Navigate to calls page
     driver.get(ORANGECARRIER_CALLS_URL)
-    time.sleep(5)
+    last_page_load = time.monotonic()
 
     # Get session cookies ONCE - will be reused for all API calls
     session_cookies = driver.get_cookies()
+    update_session_cookies(session_cookies)
     logger.info(f"✓ Got {len(session_cookies)} session cookies for API authentication")
 
-    # Thread pool for massive parallel processing - 500 concurrent calls!
-    # Each call gets its own thread for instant parallel download/upload  
-    executor = ThreadPoolExecutor(max_workers=500)  # Can handle 500+ simultaneous calls!
-    logger.info("✓ ThreadPoolExecutor configured for 500 parallel calls - NO CALL WILL BE MISSED!")
+    # Every call runs as a coroutine on the shared event loop - no thread per
+    # call, downloads share one pooled (HTTP/2) client
+    logger.info("✓ Async call processing ready - NO CALL WILL BE MISSED!")
 
     while True:
         try:
-            # Refresh the page to get latest calls
-            driver.refresh()
-            time.sleep(3)
-
-            # Refresh cookies periodically (in case they expire)
-            session_cookies = driver.get_cookies()
+            # Reload to get latest calls (every poll unless PAGE_RELOAD_INTERVAL
+            # says otherwise), or log in again if we got bounced to login
+            if 'login' in driver.current_url:
+                _relogin(driver)
+                last_page_load = time.monotonic()
+                update_session_cookies(driver.get_cookies())
+            elif (COOKIE_REFRESH_EVENT.is_set() or
+                  time.monotonic() - last_page_load >= PAGE_RELOAD_INTERVAL):
+                # Regular reload, or a download was refused with our cookies
+                driver.refresh()
+                if 'login' in driver.current_url:
+                    # Session really is gone - log in before handing out cookies,
+                    # so downloads waiting on COOKIE_REFRESH_EVENT retry with valid ones
+                    _relogin(driver)
+                last_page_load = time.monotonic()
+
+                # Refresh cookies along with the page (in case they expire)
+                update_session_cookies(driver.get_cookies())
 
             # Get active calls
             calls = get_active_calls(driver)
 
-            if calls:
-                logger.info(f"Found {len(calls)} call(s) on page")
+            if calls['id']:
+                logger.info(f"Found {len(calls['id'])} call(s) on page")
 
-                # Find NEW calls only
-                new_calls = [call for call in calls if call['id'] not in processed_calls]
+                # Find NEW calls only - dedupe on the id column, build dicts just for those
+                new_calls = [call_at(calls, i) for i, call_id in enumerate(calls['id'])
+                             if not is_processed(call_id)]
+                for call in new_calls:
+                    logger.info(f"Found call: Termination={call['termination']}, DID={call['did']}, CLI={call['cli']}, Duration={call['duration']}, Revenue={call['revenue']}, UUID={call['uuid'] or 'N/A'}, Country={call['flag']} {call['country']}")
 
                 if new_calls:
                     logger.info(f"🔥 Found {len(new_calls)} NEW call(s) - INSTANT parallel processing!")
 
                     # Mark all as processing immediately to prevent duplicates
                     for call in new_calls:
-                        processed_calls.add(call['id'])
+                        mark_processed(call['id'])
 
                     # 🔥 FIRE AND FORGET - Submit ALL calls instantly without waiting!
                     future_to_call = {}
-                    notification_ids = {}
 
                     for call in new_calls:
-                        # Send instant notification in background
-                        try:
-                            notification_msg_id = asyncio.run(send_instant_notification(call))
-                            notification_ids[call['id']] = notification_msg_id
-                        except Exception as e:
-                            logger.debug(f"Notification error for {call['id']}: {e}")
-                            notification_ids[call['id']] = None
-
-                        # Submit to thread pool IMMEDIATELY - zero delay!
-                        future = executor.submit(
-                            process_single_call,
-                            session_cookies,
-                            call,
-                            notification_ids.get(call['id'])
-                        )
+                        # Schedule on the event loop IMMEDIATELY - zero delay!
+                        future = run_async(process_single_call(call))
                         future_to_call[future] = call
                         logger.info(f"⚡ [{call['id']}] Submitted instantly!")
 
@@ -1248,8 +2047,17 @@ def monitor_calls(driver):
 
         except KeyboardInterrupt:
             logger.info("Monitoring stopped by user")
-            executor.shutdown(wait=True)
+            pool.release(driver)
             break
+        except WebDriverException as e:
+            logger.error(f"Browser error in monitoring loop: {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+
+            # The browser may have died - swap it for a fresh, logged-in one
+            driver = _replace_browser(pool, driver)
+            last_page_load = time.monotonic()
+            update_session_cookies(driver.get_cookies())
         except Exception as e:
             logger.error(f"Error in monitoring loop: {e}")
             import traceback
@@ -1259,31 +2067,32 @@ def monitor_calls(driver):
 
 def main():
     """Main function"""
-    driver = None
+    pool = BrowserPool()
 
     try:
         logger.info("="*50)
         logger.info("OrangeCarrier to Telegram Bot Starting...")
         logger.info("="*50)
 
-        # Setup driver
-        driver = setup_driver()
+        # Restore calls handled before a restart so they aren't forwarded again
+        load_processed_calls()
 
-        # Login
-        if not login_to_orangecarrier(driver):
+        # Setup logged-in browsers
+        try:
+            pool.warm_up()
+        except RuntimeError:
             logger.error("Login failed. Exiting...")
             return
 
         # Start monitoring
-        monitor_calls(driver)
+        monitor_calls(pool)
 
     except Exception as e:
         logger.error(f"Fatal error: {e}")
 
     finally:
-        if driver:
-            driver.quit()
-            logger.info("Browser closed")
+        pool.close()
+        logger.info("Browser closed")
 
 
 if __name__ == "__main__":